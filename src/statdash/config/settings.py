@@ -7,6 +7,7 @@ class Settings:
     # proj structure
     ROOT_DIR: Path = Path(__file__).parent.parent.parent.parent
     DATA_DIR: Path = ROOT_DIR / "data"
+    CACHE_DIR: Path = DATA_DIR / ".cache"
     
     # Data files
     COMPANIES_FILE: Path = DATA_DIR / "Top_1000_Companies_Dataset.csv"
@@ -0,0 +1,165 @@
+import hashlib
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Dict, Union
+import pandas as pd
+import streamlit as st
+from statdash.config.settings import settings
+
+HAS_PYARROW: bool = find_spec('pyarrow') is not None
+
+# The C engine reads the whole memory-mapped file in one chunk. The pyarrow
+# engine is not used: it infers times and dates even in columns declared
+# as category, so parsed values would differ from the C engine's strings.
+CSV_OPTIONS: Dict[str, Any] = {
+    'engine': 'c',
+    'low_memory': False,
+    'memory_map': True
+}
+
+# Predeclared column types, so pandas can skip inference on the string columns
+COMPANIES_DTYPES: Dict[str, str] = {
+    'Industry': 'category',
+    'Country': 'category'
+}
+
+SLEEP_DTYPES: Dict[str, str] = {
+    'sex': 'category',
+    'time': 'category',
+    'terms': 'category'
+}
+
+# Bump whenever a parse function changes what it returns, so Parquet copies
+# written by the previous version are no longer picked up
+PARQUET_CACHE_VERSION: int = 1
+
+def _parquet_cache_file(
+    path: Path, 
+    parse: Callable[[Path], pd.DataFrame], 
+    dtypes: Dict[str, str]
+) -> Path:
+    """
+    Get the Parquet copy location for a CSV file and the way it is parsed.
+
+    The name carries a hash of the full CSV path, its size and exact
+    modification time, the parse function, its dtype map and the cache
+    version. Replacing the file (even with an older one), changing how it
+    is parsed or two CSV files sharing a name never reuses the wrong copy.
+
+    Args:
+        path: Path to the CSV file
+        parse: Function parsing the CSV file into a DataFrame
+        dtypes: Dtype map the parse function reads the file with
+
+    Returns:
+        Path of the Parquet copy inside the cache directory
+    """
+    csv_stat = path.stat()
+    key = repr((
+        str(path.resolve()),
+        csv_stat.st_size,
+        csv_stat.st_mtime_ns,
+        parse.__name__,
+        sorted(dtypes.items()),
+        PARQUET_CACHE_VERSION
+    ))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return settings.CACHE_DIR / f"{path.stem}-{digest}.parquet"
+
+def _load_with_parquet_cache(
+    path: Union[str, Path], 
+    parse: Callable[[Path], pd.DataFrame],
+    dtypes: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Load a parsed CSV file from its Parquet copy, creating it if needed.
+
+    The copy lives in the cache directory and is rebuilt whenever the CSV
+    file changes or the copy cannot be read. The cache is best effort:
+    failing to write it never fails the load. Without pyarrow the CSV is
+    always parsed.
+
+    Args:
+        path: Path to the CSV file
+        parse: Function parsing the CSV file into a DataFrame
+        dtypes: Dtype map the parse function reads the file with
+
+    Returns:
+        DataFrame with the parsed data
+    """
+    path = Path(path)
+    if not HAS_PYARROW:
+        return parse(path)
+
+    from pyarrow import ArrowException
+    cache_errors = (OSError, ValueError, TypeError, ArrowException)
+
+    cache_file = _parquet_cache_file(path, parse, dtypes)
+    if cache_file.exists():
+        try:
+            return pd.read_parquet(cache_file)
+        except cache_errors:
+            pass # e.g. truncated copy, parse again and rewrite it below
+
+    df = parse(path)
+    # write aside and rename, so a failed write never leaves a bad copy
+    partial_file = cache_file.with_suffix('.parquet.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(partial_file, compression='zstd')
+        partial_file.replace(cache_file)
+    except cache_errors:
+        # e.g. read-only data directory or unserializable column,
+        # just parse again next time
+        try:
+            partial_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return df
+
+def _parse_companies(path: Path) -> pd.DataFrame:
+    """Parse the companies CSV file with its predeclared column types."""
+    return pd.read_csv(path, dtype=COMPANIES_DTYPES, **CSV_OPTIONS)
+
+def _parse_sleep(path: Path) -> pd.DataFrame:
+    """Parse a sleep CSV file and coerce its habit columns to float32."""
+    df = pd.read_csv(path, dtype=SLEEP_DTYPES, **CSV_OPTIONS)
+
+    habit_columns = [col for col in df.columns if col not in SLEEP_DTYPES]
+    df[habit_columns] = df[habit_columns].apply(
+        pd.to_numeric, 
+        errors='coerce', # set invalid to NaN
+        downcast='float'
+    )
+    return df
+
+@st.cache_data(show_spinner=False)
+def load_companies_csv(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read the companies CSV file, cached between Streamlit reruns and,
+    as Parquet, between app restarts.
+
+    Args:
+        path: Path to the companies CSV file
+
+    Returns:
+        DataFrame with the raw companies data
+    """
+    return _load_with_parquet_cache(path, _parse_companies, COMPANIES_DTYPES)
+
+@st.cache_data(show_spinner=False)
+def load_sleep_csv(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read a single sleep CSV file, cached between Streamlit reruns and,
+    as Parquet, between app restarts.
+
+    Habit columns are coerced to float32 here, before the files are
+    combined, so the integrated frame keeps them in a single float block.
+
+    Args:
+        path: Path to one of the sleep CSV files
+
+    Returns:
+        DataFrame with the raw sleep data
+    """
+    return _load_with_parquet_cache(path, _parse_sleep, SLEEP_DTYPES)
@@ -1,7 +1,110 @@
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
+import re
+import warnings
 import pandas as pd
 import numpy as np
-from scipy import stats
+from statdash.data.loaders import load_companies_csv
+
+# e.g. "$1,200", "1.2B", "-$500M"; the groups are a sign written before
+# the "$", the number itself and the K/M/B suffix
+_FINANCIAL_RE = re.compile(
+    r'^\s*([-+]?)\s*\$?\s*([-+]?[\d.,]+(?:E[-+]?\d+)?)\s*([KMB]?)\s*$'
+)
+_FINANCIAL_MULTIPLIERS: Dict[str, float] = {'': 1.0, 'K': 1e3, 'M': 1e6, 'B': 1e9}
+
+# column names that suggest a date
+_DATETIME_RE = re.compile(r'date|founded', re.IGNORECASE)
+
+def _column_quantiles(values: np.ndarray, q: List[float]) -> np.ndarray:
+    """
+    Compute several quantiles of every column in a single partition pass.
+    
+    np.nanquantile falls back to a per-column loop along the axis, so it is
+    only used when the array actually contains missing values.
+    
+    Args:
+        values: 2-D array with one column per variable
+        q: Quantiles to compute, between 0 and 1
+        
+    Returns:
+        Array of shape (len(q), n_columns), NaN for empty or all-NaN columns
+    """
+    if values.shape[0] == 0:
+        return np.full((len(q), values.shape[1]), np.nan)
+    if np.isnan(values).any():
+        with warnings.catch_warnings():
+            # all-NaN columns just give NaN quantiles
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanquantile(values, q, axis=0)
+    return np.quantile(values, q, axis=0)
+
+def _iqr_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Flag values outside 1.5 IQR of their column, for all columns at once.
+    
+    Args:
+        values: 2-D array with one column per variable
+        
+    Returns:
+        Boolean array of the same shape, True where a value is an outlier
+    """
+    q1, q3 = _column_quantiles(values, [0.25, 0.75])
+    iqr = q3 - q1
+    return (values < (q1 - 1.5 * iqr)) | (values > (q3 + 1.5 * iqr))
+
+def _zscore_mask(values: np.ndarray, threshold: float = 3.0) -> np.ndarray:
+    """
+    Flag values whose absolute z-score exceeds the threshold, for all columns.
+    
+    Args:
+        values: 2-D array with one column per variable
+        threshold: Absolute z-score above which a value is an outlier
+        
+    Returns:
+        Boolean array of the same shape, True where a value is an outlier
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = values.mean(axis=0, dtype=np.float64)
+        std = values.std(axis=0, dtype=np.float64)
+        z_scores = np.abs((values - mean) / std)
+    return z_scores > threshold
+
+def _describe_matrix(values: np.ndarray, columns: List[str]) -> pd.DataFrame:
+    """
+    Equivalent of DataFrame.describe() computed over a 2-D array.
+    
+    Args:
+        values: 2-D array with one column per variable
+        columns: Column names matching the array columns
+        
+    Returns:
+        DataFrame with count, mean, std, min, quartiles and max per column
+    """
+    index = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    if values.shape[0] == 0:
+        # like describe() on an empty frame: zero counts, NaN elsewhere
+        summary = np.full((len(index), values.shape[1]), np.nan)
+        summary[0] = 0
+        return pd.DataFrame(summary, index=index, columns=columns)
+        
+    with warnings.catch_warnings():
+        # all-NaN columns just give NaN statistics, as describe() does
+        warnings.simplefilter('ignore', RuntimeWarning)
+        quartiles = _column_quantiles(values, [0.25, 0.5, 0.75])
+        summary = np.vstack([
+            np.count_nonzero(~np.isnan(values), axis=0),
+            np.nanmean(values, axis=0),
+            np.nanstd(values, axis=0, ddof=1),
+            np.nanmin(values, axis=0),
+            quartiles,
+            np.nanmax(values, axis=0)
+        ])
+        
+    return pd.DataFrame(
+        summary,
+        index=index,
+        columns=columns
+    )
 
 class CompaniesDataProcessor:
     """A class to handle and analysis of the Top 1000 Companies Dataset"""
@@ -11,14 +114,22 @@ class CompaniesDataProcessor:
         Initialize the processor with optional dataframe.
         
         Args:
-            df: Optional pandas DataFrame containing companies data
+            df: Optional pandas DataFrame containing companies data; it is
+                copied, so processing never modifies the caller's frame
         """
-        self.raw_data = df
+        self.raw_data = df.copy() if df is not None else None
         self.processed_data = None
         self.numerical_columns: List[str] = []
         self.categorical_columns: List[str] = []
         self.datetime_columns: List[str] = []
         
+        # cleaned numerical columns as a single contiguous float64 block
+        self._num_matrix: Optional[np.ndarray] = None
+        
+        # summary statistics, keyed on the frame they were computed for
+        self._stats_cache: Dict[str, Any] = {}
+        self._stats_key: Optional[int] = None
+        
     def load_data(self, filepath: str) -> None:
         """
         Load data from CSV file.
@@ -26,7 +137,7 @@ class CompaniesDataProcessor:
         Args:
             filepath: Path to the CSV file
         """
-        self.raw_data = pd.read_csv(filepath)
+        self.raw_data = load_companies_csv(filepath)
         
     def identify_column_types(self) -> Dict[str, List[str]]:
         """
@@ -40,20 +151,26 @@ class CompaniesDataProcessor:
             
         # Identify numerical columns
         self.numerical_columns = self.raw_data.select_dtypes(
-            include=['int64', 'float64']
+            include='number', exclude='timedelta'
         ).columns.tolist()
         
         # Identify categorical columns
         self.categorical_columns = self.raw_data.select_dtypes(
-            include=['object', 'category']
+            include=['object', 'category', 'string']
         ).columns.tolist()
         
         # Look for potential datetime columns
         self.datetime_columns = [
-            col for col in self.categorical_columns 
-            if 'date' in col.lower() or 'founded' in col.lower()
+            col for col in self.categorical_columns if _DATETIME_RE.search(col)
         ]
         
+        # low-cardinality string columns are stored as categoricals, so
+        # value counts and grouping work on integer codes
+        n_rows = len(self.raw_data)
+        for col in self.categorical_columns:
+            if n_rows and self.raw_data[col].nunique() / n_rows < 0.5:
+                self.raw_data[col] = self.raw_data[col].astype('category')
+        
         return {
             'numerical': self.numerical_columns,
             'categorical': self.categorical_columns,
@@ -63,11 +180,14 @@ class CompaniesDataProcessor:
     def clean_numerical_columns(self) -> None:
         """
         Clean numerical columns by handling missing values and outliers.
+        
+        The processor owns its raw data (a fresh frame from load_data or a
+        copy of the one passed in), so cleaning is done in place on it.
         """
         if self.raw_data is None:
             raise ValueError("No data loaded. Please load data first.")
             
-        self.processed_data = self.raw_data.copy()
+        self.processed_data = self.raw_data
         
         for col in self.numerical_columns:
             # Convert string representations of numbers (e.g., "1.2B", "$500M")
@@ -75,10 +195,22 @@ class CompaniesDataProcessor:
                 self.processed_data[col] = self._convert_financial_string(
                     self.processed_data[col]
                 )
-            
-            # Handle missing values
-            median_value = self.processed_data[col].median()
-            self.processed_data[col] = self.processed_data[col].fillna(median_value)
+            # nullable Int64/Float64 columns cannot take a fractional median
+            elif pd.api.types.is_extension_array_dtype(self.processed_data[col]):
+                self.processed_data[col] = self.processed_data[col].astype(
+                    np.float64
+                )
+        
+        # Handle missing values, all columns filled in a single pass;
+        # all-missing columns have no median and are left as they are
+        medians = self.processed_data[self.numerical_columns].median()
+        self.processed_data.fillna(medians.dropna().to_dict(), inplace=True)
+        
+        self._num_matrix = np.ascontiguousarray(
+            self.processed_data[self.numerical_columns].to_numpy(
+                dtype=np.float64, copy=False
+            )
+        )
             
     @staticmethod
     def _convert_financial_string(series: pd.Series) -> pd.Series:
@@ -91,50 +223,54 @@ class CompaniesDataProcessor:
         Returns:
             Converted series with float values
         """
-        def convert_value(val):
-            if pd.isna(val):
-                return np.nan
-            if isinstance(val, (int, float)):
-                return val
-                
-            val = str(val).upper()
-            val = val.replace('$', '').replace(',', '')
-            
-            multipliers = {'K': 1e3, 'M': 1e6, 'B': 1e9}
-            for suffix, multiplier in multipliers.items():
-                if val.endswith(suffix):
-                    try:
-                        return float(val[:-1]) * multiplier
-                    except ValueError:
-                        return np.nan
-            try:
-                return float(val)
-            except ValueError:
-                return np.nan
-                
-        return series.apply(convert_value)
+        parts = series.astype(str).str.upper().str.extract(_FINANCIAL_RE)
+        
+        numbers = pd.to_numeric(
+            parts[0] + parts[1].str.replace(',', '', regex=False), 
+            errors='coerce' # set invalid to NaN
+        )
+        multipliers = parts[2].map(_FINANCIAL_MULTIPLIERS).fillna(1.0)
         
-    def get_summary_statistics(self) -> Dict[str, pd.DataFrame]:
+        return pd.Series(
+            numbers.to_numpy() * multipliers.to_numpy(),
+            index=series.index,
+            name=series.name
+        )
+        
+    def get_summary_statistics(self) -> Dict[str, Any]:
         """
         Calculate summary statistics for numerical and categorical columns.
         
+        The result is computed once per processed frame and reused on
+        subsequent calls.
+        
         Returns:
-            Dictionary containing summary statistics for different column types
+            Dictionary containing the numerical statistics DataFrame and a
+            dictionary of top value counts per categorical column
         """
         if self.processed_data is None:
             raise ValueError("Data not processed. Please process data first.")
             
-        numerical_stats = self.processed_data[self.numerical_columns].describe()
+        key = id(self.processed_data)
+        if key == self._stats_key:
+            return self._stats_cache
+            
+        numerical_stats = _describe_matrix(
+            self._numerical_values(self.numerical_columns), 
+            self.numerical_columns
+        )
         
-        categorical_stats = pd.DataFrame({
+        categorical_stats = {
             col: self.processed_data[col].value_counts().head()
             for col in self.categorical_columns
-        })
+        }
         
-        return {
+        self._stats_key = key
+        self._stats_cache = {
             'numerical_statistics': numerical_stats,
             'categorical_statistics': categorical_stats
         }
+        return self._stats_cache
         
     def detect_outliers(
         self, 
@@ -154,21 +290,43 @@ class CompaniesDataProcessor:
         if columns is None:
             columns = self.numerical_columns
             
-        outliers = {}
-        for col in columns:
-            if method == 'iqr':
-                Q1 = self.processed_data[col].quantile(0.25)
-                Q3 = self.processed_data[col].quantile(0.75)
-                IQR = Q3 - Q1
-                outliers[col] = (
-                    (self.processed_data[col] < (Q1 - 1.5 * IQR)) | 
-                    (self.processed_data[col] > (Q3 + 1.5 * IQR))
-                )
-            elif method == 'zscore':
-                z_scores = np.abs(stats.zscore(self.processed_data[col]))
-                outliers[col] = z_scores > 3
-            else:
-                # TODO: add more outlier detection methods
-                raise ValueError("method not implmented yet!")
+        if method == 'iqr':
+            kernel = _iqr_mask
+        elif method == 'zscore':
+            kernel = _zscore_mask
+        else:
+            # TODO: add more outlier detection methods
+            raise ValueError("method not implmented yet!")
+            
+        # one vectorized pass over all requested columns
+        mask = kernel(self._numerical_values(columns))
+        
+        outliers = {
+            col: pd.Series(mask[:, j], index=self.processed_data.index, name=col)
+            for j, col in enumerate(columns)
+        }
                 
         return outliers
+        
+    def _numerical_values(self, columns: List[str]) -> np.ndarray:
+        """
+        Get the values of the given columns as a 2-D float64 array.
+        
+        Columns that are part of the cleaned numerical block are sliced from
+        it; anything else is converted from the processed data.
+        
+        Args:
+            columns: List of columns to get values for
+            
+        Returns:
+            Array with one column per requested column
+        """
+        if self._num_matrix is not None and all(
+            col in self.numerical_columns for col in columns
+        ):
+            if columns == self.numerical_columns:
+                return self._num_matrix
+            positions = [self.numerical_columns.index(col) for col in columns]
+            return self._num_matrix[:, positions]
+            
+        return self.processed_data[columns].to_numpy(dtype=np.float64)
@@ -1,8 +1,11 @@
 from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
-from scipy import stats
 from statdash.config.settings import settings
+from statdash.data.loaders import load_sleep_csv
+
+# columns describing a record rather than a habit
+_NON_HABIT = frozenset({'sex', 'time', 'terms', 'source'})
 
 class SleepDataProcessor:
     """A class to handle and analysis of the Quality of Sleep Dataset"""
@@ -22,6 +25,10 @@ class SleepDataProcessor:
         self.terms: List[str] = []
         self.habits: List[str] = []
         
+        # summary statistics, keyed on the frame they were computed for
+        self._stats_cache: Dict[str, pd.DataFrame] = {}
+        self._stats_key: Optional[int] = None
+        
     def load_data(self) -> None:
         """
         Load data from all three sleep-related CSV files.
@@ -29,7 +36,7 @@ class SleepDataProcessor:
         try:
             for key, file_path in settings.SLEEP_FILES.items():
                 try:
-                    self.raw_data[key] = pd.read_csv(file_path)
+                    self.raw_data[key] = load_sleep_csv(file_path)
                 except Exception as e:
                     raise ValueError(f"Error reading {key} file: {str(e)}")
             
@@ -55,8 +62,7 @@ class SleepDataProcessor:
         self.time_periods = df['time'].unique().tolist()
         self.terms = df['terms'].unique().tolist()
         # Get habit columns by excluding known non-habit columns
-        self.habits = [col for col in df.columns 
-                      if col not in ['sex', 'time', 'terms']]
+        self.habits = [col for col in df.columns if col not in _NON_HABIT]
     
     def integrate_datasets(self) -> None:
         """
@@ -70,33 +76,42 @@ class SleepDataProcessor:
         if any(df is None for df in self.raw_data.values()):
             raise ValueError("Not all data files have been loaded")
             
-        # create identifier columns to track data source
-        dfs = []
-        for source, df in self.raw_data.items():
-            if df is not None:  # Extra safety check
-                df_copy = df.copy()
-                df_copy['source'] = source
-                dfs.append(df_copy)
+        dfs = {
+            source: df for source, df in self.raw_data.items() 
+            if df is not None  # Extra safety check
+        }
         
         if not dfs:  
             raise ValueError("No valid datasets to combine")
             
-        self.processed_data = pd.concat(dfs, axis=0, ignore_index=True)
+        # concat on a dict keys every row by its source, which is then
+        # promoted to a column without copying each frame beforehand;
+        # the original row number within each file is kept as the index
+        self.processed_data = pd.concat(
+            dfs, names=['source', 'row']
+        ).reset_index('source')
         
-        # convert frequency columns to numeric, handling any non-numeric values
-        habit_columns = [col for col in self.processed_data.columns 
-                        if col not in ['sex', 'time', 'terms', 'source']]
+        # keep source as the last column, where it used to be appended
+        self.processed_data = self.processed_data[[
+            *(col for col in self.processed_data.columns if col != 'source'),
+            'source'
+        ]]
         
-        for col in habit_columns:
-            self.processed_data[col] = pd.to_numeric(
-                self.processed_data[col], 
-                errors='coerce' # set invalid to NaN
-            )
+        # files with different categories concat to object, so re-encode
+        categorical_columns = [
+            col for col in self.processed_data.columns if col in _NON_HABIT
+        ]
+        self.processed_data[categorical_columns] = self.processed_data[
+            categorical_columns
+        ].astype('category')
     
     def get_summary_statistics(self) -> Dict[str, pd.DataFrame]:
         """
         Calculate summary statistics for the integrated dataset.
         
+        The result is computed once per processed frame and reused on
+        subsequent calls.
+        
         Returns:
             Dictionary containing various statistical summaries:
             - Frequency distributions by gender
@@ -106,18 +121,59 @@ class SleepDataProcessor:
         if self.processed_data is None:
             raise ValueError("Data has not been processed yet")
             
+        key = id(self.processed_data)
+        if key == self._stats_key:
+            return self._stats_cache
+            
         stats = {}
         
         # gender distribution across different times
-        stats['gender_time'] = pd.crosstab(
-            self.processed_data['sex'],
-            self.processed_data['time']
-        )
+        stats['gender_time'] = self._count_pairs('sex', 'time')
         
         # overall frequency of different habits
         habit_columns = [col for col in self.processed_data.columns 
-                        if col not in ['sex', 'time', 'terms', 'source']]
+                        if col not in _NON_HABIT]
         
         stats['habit_summary'] = self.processed_data[habit_columns].describe()
         
+        self._stats_key, self._stats_cache = key, stats
         return stats
+    
+    def _count_pairs(self, row_col: str, col_col: str) -> pd.DataFrame:
+        """
+        Cross-tabulate two categorical columns by counting their codes.
+        
+        Gives the same table as pd.crosstab, but counts the integer codes
+        with np.bincount instead of factorizing and grouping. Categories
+        that never occur together with a value of the other column are
+        dropped, as crosstab does.
+        
+        Args:
+            row_col: Column whose categories form the rows
+            col_col: Column whose categories form the columns
+            
+        Returns:
+            DataFrame of counts for every observed pair of categories
+        """
+        rows = self.processed_data[row_col].cat
+        cols = self.processed_data[col_col].cat
+        n_rows, n_cols = len(rows.categories), len(cols.categories)
+        
+        row_codes = rows.codes.to_numpy()
+        col_codes = cols.codes.to_numpy()
+        observed = (row_codes >= 0) & (col_codes >= 0) # -1 marks NaN
+        
+        counts = np.bincount(
+            row_codes[observed].astype(np.intp) * n_cols + col_codes[observed],
+            minlength=n_rows * n_cols
+        ).reshape(n_rows, n_cols)
+        
+        # drop unused categories and those only seen next to a missing value
+        keep_rows = counts.sum(axis=1) > 0
+        keep_cols = counts.sum(axis=0) > 0
+        
+        return pd.DataFrame(
+            counts[keep_rows][:, keep_cols],
+            index=pd.Index(rows.categories[keep_rows], name=row_col),
+            columns=pd.Index(cols.categories[keep_cols], name=col_col)
+        )
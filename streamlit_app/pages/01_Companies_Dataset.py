@@ -14,10 +14,15 @@ class CompaniesPage:
     def load_data(self) -> None:
         """Load and process the companies data."""
         try:
-            self.processor = CompaniesDataProcessor()
-            self.processor.load_data(settings.COMPANIES_FILE)
-            self.processor.identify_column_types()
-            self.processor.clean_numerical_columns()
+            # reuse the processed data across reruns of this session
+            if 'companies_processor' in st.session_state:
+                self.processor = st.session_state.companies_processor
+            else:
+                self.processor = CompaniesDataProcessor()
+                self.processor.load_data(settings.COMPANIES_FILE)
+                self.processor.identify_column_types()
+                self.processor.clean_numerical_columns()
+                
             self.data = self.processor.processed_data
             if self.data is None or self.data.empty:
                 st.error("No data was loaded")
@@ -27,6 +32,7 @@ class CompaniesPage:
                 st.warning("No numerical columns found in the data")
                 return False
             
+            st.session_state.companies_processor = self.processor
             return True
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
@@ -47,6 +53,11 @@ class CompaniesPage:
                     st.write("Numerical Statistics")
                     st.dataframe(stats['numerical_statistics'])
                     
+                    st.write("Most Frequent Categories")
+                    for col, counts in stats['categorical_statistics'].items():
+                        st.caption(col)
+                        st.dataframe(counts)
+                    
     def show_interactive_analysis(self) -> None:
         """Display interactive analysis options."""
         st.header("Interactive Analysis")
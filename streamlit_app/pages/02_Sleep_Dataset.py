@@ -17,9 +17,15 @@ class SleepAnalysisPage:
             bool: True if data loaded successfully, False otherwise
         """
         try:
+            # reuse the processed data across reruns of this session
+            if 'sleep_processor' in st.session_state:
+                self.processor = st.session_state.sleep_processor
+                return True
+                
             self.processor = SleepDataProcessor()
             self.processor.load_data()
             self.processor.integrate_datasets()
+            st.session_state.sleep_processor = self.processor
             return True
             
         except Exception as e: